@@ -7,55 +7,193 @@ Calculate geographic extents of a raster dataset using GDAL.
 
 This script is designed to be run inside a Docker container with GDAL installed.
 It calculates the geographic extents (north, south, east, west) of a raster dataset
-and outputs the result as JSON.
+and outputs the result as JSON. If given a directory, it outputs a JSON object mapping
+each raster in the directory to its extents.
+
+The functions can also be imported and called in-process, which avoids paying the
+interpreter and GDAL start-up cost per dataset and keeps cached transformations warm.
 """
 
+import argparse
 import os
 import sys
 import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
 from osgeo import gdal, osr
 
+__all__ = ["get_extents", "get_extents_many", "get_extents_parallel", "list_rasters", "main"]
+
+# Number of points sampled along each raster edge when reprojecting its boundary
+EDGE_SAMPLES: int = 21
+
+# Decimal places kept in JSON output (about 0.01 mm at the equator)
+OUTPUT_PRECISION: int = 10
+
+# Sidecar files that GDAL can identify as rasters but that carry no georeferencing
+SIDECAR_SUFFIXES: tuple = (".ovr", ".aux.xml", ".msk")
+
+
+# Target spatial reference (WGS84) in lon/lat order, shared by all transformations
+_WGS84 = osr.SpatialReference()
+_WGS84.ImportFromEPSG(4326)
+_WGS84.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+
+
+@lru_cache(maxsize=64)
+def _get_transform(src_wkt: str) -> Optional[osr.CoordinateTransformation]:
+    """
+    Returns a cached coordinate transformation from the source CRS to WGS84.
+
+    Constructing a transformation requires a PROJ database lookup, so transformations
+    are reused for datasets that share the same source CRS. The cache is keyed on the
+    WKT string rather than ds.GetSpatialRef(), whose SWIG wrappers hash by identity,
+    so the WKT is only parsed on a cache miss.
+
+    :param src_wkt: WKT of the source CRS. An empty string is treated as WGS84.
+    :return: Coordinate transformation from the source CRS to WGS84, or None if the
+             source is already WGS84 and no transformation is needed.
+    """
+    # If no projection, assume WGS84
+    if not src_wkt:
+        return None
+
+    src_srs = osr.SpatialReference()
+    src_srs.ImportFromWkt(src_wkt)
+
+    # Force x/y (lon/lat) axis order to match the target so points never need to be
+    # swapped, regardless of the axis order declared by the CRS authority
+    src_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+
+    # Skip building a PROJ pipeline when the source is already the target CRS
+    if src_srs.IsSame(_WGS84):
+        return None
+
+    return osr.CoordinateTransformation(src_srs, _WGS84)
+
+
+def _transform_points(transform: Optional[osr.CoordinateTransformation], points: list) -> list:
+    """
+    Transforms a list of (x, y) points to WGS84 (lon, lat) pairs in a single call.
+
+    TransformPoints leaves points that fail to transform (e.g. outside the projection's
+    valid area) as infinite values; like TransformBounds, those points are dropped.
+
+    :param transform: Coordinate transformation to WGS84, or None if the points are already WGS84.
+    :param points: List of (x, y) tuples in the source CRS.
+    :return: List of (lon, lat) tuples.
+    :raises Exception: If none of the points could be transformed.
+    """
+    if transform is None:
+        return points
+
+    geo_points = [
+        (lon, lat) for lon, lat, _ in transform.TransformPoints(points)
+        if math.isfinite(lon) and math.isfinite(lat)
+    ]
+    if not geo_points:
+        raise Exception(f"None of the {len(points)} sampled points could be transformed to WGS84")
+    return geo_points
+
+
+def _extents_from_points(points: list, wrap_antimeridian: bool = False) -> dict:
+    """
+    Returns the bounding extents of a list of WGS84 (lon, lat) points.
+
+    With wrap_antimeridian, points that cross the antimeridian are reported with
+    west > east, matching CoordinateTransformation.TransformBounds. Only reprojected
+    points can jump across the antimeridian; points that were already WGS84 are
+    reduced with a plain min/max.
+
+    :param points: Sequence of (lon, lat) pairs.
+    :param wrap_antimeridian: Whether to detect footprints crossing the antimeridian.
+    :return: Dictionary with keys 'north', 'south', 'east', 'west' representing the extents.
+    """
+    # Split into longitude and latitude columns in one pass
+    lons, lats = zip(*points)
+    west, east = min(lons), max(lons)
+
+    if wrap_antimeridian:
+        # Reprojected boundary samples and GCPs are assumed to be dense enough that a
+        # footprint never leaves a band wider than 180 degrees of longitude empty, so such
+        # a gap between neighbouring longitudes is the antimeridian jump
+        sorted_lons = sorted(lons)
+        gaps = [(b - a, i) for i, (a, b) in enumerate(zip(sorted_lons, sorted_lons[1:]))]
+        gap, i = max(gaps, default=(0.0, 0))
+        if gap > 180:
+            west, east = sorted_lons[i + 1], sorted_lons[i]
+
+    return {
+        "north": max(lats),
+        "south": min(lats),
+        "east": east,
+        "west": west
+    }
+
+
+def _densify_ring(corners: list, samples_per_edge: int) -> list:
+    """
+    Returns points sampled along the closed ring through the given corners.
+
+    Each edge contributes samples_per_edge points, including its start corner but not its
+    end corner (which starts the next edge), so 4 corners with 21 samples give 80 points.
+
+    :param corners: List of (x, y) corner tuples in ring order.
+    :param samples_per_edge: Number of points to sample along each edge.
+    :return: List of (x, y) tuples along the ring.
+    """
+    steps = max(samples_per_edge - 1, 1)
+    points = []
+    for (x0, y0), (x1, y1) in zip(corners, corners[1:] + corners[:1]):
+        points.extend(
+            (x0 + (x1 - x0) * i / steps, y0 + (y1 - y0) * i / steps)
+            for i in range(steps)
+        )
+    return points
+
+
+def _open_dataset(dataset_path: str) -> Optional[gdal.Dataset]:
+    """
+    Opens a dataset read-only as a raster, without listing its directory.
+
+    Only georeferencing is needed and sidecar files are still found by probing them
+    directly. GDAL_DISABLE_READDIR_ON_OPEN is set thread-locally for the duration of
+    the open only, so callers' later GDAL work is unaffected, and a caller's own
+    setting of the option is respected.
+
+    :param dataset_path: Path to the raster dataset.
+    :return: Opened GDAL dataset, or None if it could not be opened.
+    """
+    # Open read-only as a raster so no update or vector drivers are probed
+    open_flags = gdal.OF_RASTER | gdal.OF_READONLY
+    if gdal.GetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN") is not None:
+        return gdal.OpenEx(dataset_path, open_flags)
+
+    gdal.SetThreadLocalConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "TRUE")
+    try:
+        return gdal.OpenEx(dataset_path, open_flags)
+    finally:
+        gdal.SetThreadLocalConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", None)
+
 
 def get_extents(dataset_path: str) -> dict:
     """
     Returns the geographic extents of the given raster dataset.
 
+    Extents are WGS84 degrees. If the footprint crosses the antimeridian, west is greater
+    than east (the convention used by Cesium.Rectangle), whichever path computed them.
+
     :param dataset_path: Path to the raster dataset.
     :return: Dictionary with keys 'north', 'south', 'east', 'west' representing the extents.
     """
+    ds = None
     try:
-        # Open the dataset
-        ds = gdal.Open(dataset_path)
+        ds = _open_dataset(dataset_path)
         if ds is None:
             raise Exception(f"Unable to open dataset at {dataset_path}")
 
-        # Get the source spatial reference
-        projection = ds.GetProjection()
-        src_srs = osr.SpatialReference()
-        if projection:
-            src_srs.ImportFromWkt(projection)
-        else:
-            # If no projection, assume WGS84
-            src_srs.ImportFromEPSG(4326)
-
-        # Define the target spatial reference (WGS84)
-        tgt_srs = osr.SpatialReference()
-        tgt_srs.ImportFromEPSG(4326)
-
-        # Create coordinate transformation
-        transform = osr.CoordinateTransformation(src_srs, tgt_srs)
-
-        # Get the axis mapping to determine coordinate order
-        # For geographic CRS, we need to check the axis order
-        # For projected CRS, X is typically easting, Y is northing
-        is_geographic = src_srs.IsGeographic()
-        is_projected = src_srs.IsProjected()
-
-        # Get the axis mapping from the CRS
-        # This is a bit tricky - we need to check the axis order in the CRS
-        # For geographic CRS, the order might be lat/lon or lon/lat
-        # For projected CRS, it's typically X/Y (easting/northing)
-
         # Get image dimensions
         x_size = ds.RasterXSize
         y_size = ds.RasterYSize
@@ -71,135 +209,172 @@ def get_extents(dataset_path: str) -> dict:
             geotransform[4] == 0.0 and geotransform[5] == 1.0
         )
 
-        # Get GCPs if available
-        gcps = ds.GetGCPs()
-        gcp_projection = ds.GetGCPProjection()
+        # Use GCPs if geotransform is default and GCPs are available; GCP objects are only
+        # materialized when they are actually used
+        if is_default_geotransform and ds.GetGCPCount() > 0:
+            # Use GCPs to calculate extents; an empty GCP projection is treated as WGS84
+            gcp_transform = _get_transform(ds.GetGCPProjection())
 
-        # Use GCPs if geotransform is default and GCPs are available
-        if is_default_geotransform and gcps and len(gcps) > 0:
-            # Use GCPs to calculate extents
-            if gcp_projection:
-                gcp_srs = osr.SpatialReference()
-                gcp_srs.ImportFromWkt(gcp_projection)
-            else:
-                # If no GCP projection, assume WGS84
-                gcp_srs = osr.SpatialReference()
-                gcp_srs.ImportFromEPSG(4326)
-
-            # Create transformation from GCP CRS to WGS84
-            gcp_transform = osr.CoordinateTransformation(gcp_srs, tgt_srs)
-
-            # Extract geographic coordinates from GCPs
-            geo_corners = []
-            for gcp in gcps:
-                x, y = gcp.GCPX, gcp.GCPY
-                try:
-                    # Transform GCP coordinates to WGS84
-                    lon, lat, _ = gcp_transform.TransformPoint(x, y)
-                    # Check if result makes sense
-                    if -90 <= lat <= 90 and -180 <= lon <= 180:
-                        geo_corners.append((lon, lat))
-                    else:
-                        # Try swapping coordinates if result doesn't make sense
-                        lat, lon, _ = gcp_transform.TransformPoint(y, x)
-                        geo_corners.append((lon, lat))
-                except:
-                    # If transformation fails, try swapping coordinates
-                    try:
-                        lat, lon, _ = gcp_transform.TransformPoint(y, x)
-                        geo_corners.append((lon, lat))
-                    except:
-                        # Last resort: use coordinates as-is (assuming they're already WGS84)
-                        geo_corners.append((x, y))
-        else:
-            # Use the full geotransform to calculate corner coordinates.
-            # GeoTransform: [x_origin, pixel_width, x_rotation, y_origin, y_rotation, pixel_height]
-            # Full formula:
-            #   x_geo = gt[0] + col * gt[1] + row * gt[2]
-            #   y_geo = gt[3] + col * gt[4] + row * gt[5]
-            # This correctly handles images with rotation (non-zero gt[2] and gt[4]).
-            corners_pixel = [
-                (0, 0),                  # Top-left
-                (x_size, 0),             # Top-right
-                (x_size, y_size),        # Bottom-right
-                (0, y_size)              # Bottom-left
-            ]
-
-            corners = []
-            for col, row in corners_pixel:
-                x = geotransform[0] + col * geotransform[1] + row * geotransform[2]
-                y = geotransform[3] + col * geotransform[4] + row * geotransform[5]
-                corners.append((x, y))
-
-            # Transform all corners to WGS84
-            geo_corners = []
-            for i, (x, y) in enumerate(corners):
-                if is_geographic:
-                    # For geographic CRS, we need to check if the order is lat/lon or lon/lat
-                    # Most modern geographic CRS use lon/lat order, but some older ones use lat/lon
-                    # We'll try the standard lon/lat order first
-                    try:
-                        # Try standard lon/lat order
-                        lon, lat, _ = transform.TransformPoint(x, y)
-                        # Check if the result makes sense (lat should be between -90 and 90)
-                        if -90 <= lat <= 90 and -180 <= lon <= 180:
-                            geo_corners.append((lon, lat))
-                        else:
-                            # If not, try lat/lon order
-                            lat, lon, _ = transform.TransformPoint(y, x)
-                            geo_corners.append((lon, lat))
-                    except:
-                        # If transformation fails, try lat/lon order
-                        try:
-                            lat, lon, _ = transform.TransformPoint(y, x)
-                            geo_corners.append((lon, lat))
-                        except:
-                            # Last resort: use the original order
-                            lon, lat, _ = transform.TransformPoint(x, y)
-                            geo_corners.append((lon, lat))
-                else:
-                    # For projected CRS, X is typically easting, Y is northing
-                    # TransformPoint should handle the conversion correctly
-                    try:
-                        lon, lat, _ = transform.TransformPoint(x, y)
-                        geo_corners.append((lon, lat))
-                    except Exception as e:
-                        # If transformation fails, try swapping coordinates
-                        try:
-                            lon, lat, _ = transform.TransformPoint(y, x)
-                            geo_corners.append((lon, lat))
-                        except:
-                            # Last resort: use the original order
-                            lon, lat, _ = transform.TransformPoint(x, y)
-                            geo_corners.append((lon, lat))
-
-        # Extract longitudes and latitudes
-        lons = [coord[0] for coord in geo_corners]
-        lats = [coord[1] for coord in geo_corners]
-
-        # Compute extents
-        extents = {
-            "north": max(lats),
-            "south": min(lats),
-            "east": max(lons),
-            "west": min(lons)
-        }
-
-        return extents
+            # Transform all GCP coordinates to WGS84 in a single call
+            geo_points = _transform_points(gcp_transform, [(gcp.GCPX, gcp.GCPY) for gcp in ds.GetGCPs()])
+            return _extents_from_points(geo_points, wrap_antimeridian=gcp_transform is not None)
+
+        transform = _get_transform(ds.GetProjection())
+
+        # Without rotation the footprint is the axis-aligned box spanned by the geotransform,
+        # which GDAL 3.4+ reprojects with edge densification in a single call
+        is_rotated = geotransform[2] != 0.0 or geotransform[4] != 0.0
+        if transform is not None and not is_rotated and hasattr(transform, "TransformBounds"):
+            x_min, x_max = sorted((geotransform[0], geotransform[0] + x_size * geotransform[1]))
+            y_min, y_max = sorted((geotransform[3], geotransform[3] + y_size * geotransform[5]))
+            west, south, east, north = transform.TransformBounds(x_min, y_min, x_max, y_max, EDGE_SAMPLES)
+            return {
+                "north": north,
+                "south": south,
+                "east": east,
+                "west": west
+            }
+
+        # Otherwise use the full geotransform to calculate boundary coordinates.
+        # GeoTransform: [x_origin, pixel_width, x_rotation, y_origin, y_rotation, pixel_height]
+        # Full formula:
+        #   x_geo = gt[0] + col * gt[1] + row * gt[2]
+        #   y_geo = gt[3] + col * gt[4] + row * gt[5]
+        # This correctly handles images with rotation (non-zero gt[2] and gt[4]).
+        corners_pixel = [
+            (0, 0),                  # Top-left
+            (x_size, 0),             # Top-right
+            (x_size, y_size),        # Bottom-right
+            (0, y_size)              # Bottom-left
+        ]
+
+        # Edges of a reprojected raster may curve outside the bounding box of its corners,
+        # so sample along each edge. A WGS84 source maps the edges linearly and only
+        # needs the corners.
+        samples_per_edge = EDGE_SAMPLES if transform is not None else 1
+        boundary = [
+            (geotransform[0] + col * geotransform[1] + row * geotransform[2],
+             geotransform[3] + col * geotransform[4] + row * geotransform[5])
+            for col, row in _densify_ring(corners_pixel, samples_per_edge)
+        ]
+
+        # Transform the whole boundary to WGS84 in a single call
+        geo_points = _transform_points(transform, boundary)
+        return _extents_from_points(geo_points, wrap_antimeridian=transform is not None)
 
     except Exception as e:
         raise Exception(f"Error calculating extents: {str(e)}")
 
+    finally:
+        # Close the dataset now rather than whenever it is garbage collected, so file
+        # handles are released promptly when processing many datasets
+        ds = None
 
-if __name__ == "__main__":
+
+def _get_extents_or_error(dataset_path: str) -> dict:
+    """Returns the extents of a dataset, or {"error": "<message>"} if they cannot be calculated."""
     try:
-        if len(sys.argv) != 2:
-            print("Usage: python3 calculate_extents.py <dataset_path>", file=sys.stderr)
-            sys.exit(1)
+        return get_extents(dataset_path)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def get_extents_many(dataset_paths: list) -> dict:
+    """
+    Returns the geographic extents of each of the given raster datasets.
 
-        dataset_path = sys.argv[1]
-        extents = get_extents(dataset_path)
-        print(json.dumps(extents))
+    Processing many datasets in one process lets them share cached coordinate
+    transformations, so one transformation is built per unique source CRS rather
+    than one per dataset.
+
+    A dataset that fails does not abort the batch; its entry is {"error": "<message>"}.
+
+    :param dataset_paths: Paths to the raster datasets.
+    :return: Dictionary mapping each dataset path to its extents or error dictionary.
+    """
+    return {dataset_path: _get_extents_or_error(dataset_path) for dataset_path in dataset_paths}
+
+
+def get_extents_parallel(dataset_paths: list, max_workers: Optional[int] = None) -> dict:
+    """
+    Returns the geographic extents of each of the given raster datasets using a pool of
+    worker processes.
+
+    PROJ transformation objects are not thread-safe, so work is spread across processes,
+    each of which keeps its own cache of coordinate transformations. As with
+    get_extents_many, a dataset that fails is recorded as {"error": "<message>"}.
+
+    :param dataset_paths: Paths to the raster datasets.
+    :param max_workers: Number of worker processes. Defaults to the number of CPUs.
+    :return: Dictionary mapping each dataset path to its extents or error dictionary.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(dataset_paths, pool.map(_get_extents_or_error, dataset_paths)))
+
+
+def list_rasters(directory: str) -> list:
+    """
+    Returns the paths of the files in a directory that GDAL can open as rasters.
+
+    Sidecar files such as overviews (.ovr) and PAM metadata (.aux.xml) are skipped.
+
+    :param directory: Directory to scan (non-recursively).
+    :return: Sorted list of raster dataset paths.
+    """
+    paths = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if not name.lower().endswith(SIDECAR_SUFFIXES)
+    )
+    return [
+        path for path in paths
+        if os.path.isfile(path) and gdal.IdentifyDriverEx(path, gdal.OF_RASTER) is not None
+    ]
+
+
+def _round_extents(extents: dict) -> dict:
+    """Rounds extents to OUTPUT_PRECISION decimal places for output, leaving error messages as-is."""
+    return {
+        key: round(value, OUTPUT_PRECISION) if isinstance(value, float) else value
+        for key, value in extents.items()
+    }
+
+
+def main(argv: Optional[list] = None) -> None:
+    """
+    Command-line entry point that prints the extents of a dataset, or of every raster in a
+    directory, as JSON.
+
+    :param argv: Command-line arguments. Defaults to sys.argv[1:].
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Calculate the geographic extents of raster datasets using GDAL.")
+    parser.add_argument("dataset_path", help="Path to a raster dataset, or to a directory of raster datasets")
+    parser.add_argument("-w",
+                        "--workers",
+                        required=False,
+                        type=int,
+                        default=1,
+                        help="Number of worker processes to use for a directory. Use 0 for one per CPU.")
+    args = parser.parse_args(argv)
+
+    try:
+        if os.path.isdir(args.dataset_path):
+            # Batch mode: output a mapping of each raster path to its extents or error
+            dataset_paths = list_rasters(args.dataset_path)
+            if args.workers == 1:
+                extents_by_path = get_extents_many(dataset_paths)
+            else:
+                extents_by_path = get_extents_parallel(dataset_paths, max_workers=args.workers or None)
+            output = {path: _round_extents(extents) for path, extents in extents_by_path.items()}
+        else:
+            output = _round_extents(get_extents(args.dataset_path))
+
+        # Compact output; it is only parsed by the caller
+        print(json.dumps(output, separators=(",", ":")))
     except Exception as e:
         print(f"ERROR: {str(e)}", file=sys.stderr)
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
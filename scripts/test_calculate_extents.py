@@ -0,0 +1,153 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+"""
+Tests for calculate_extents.
+
+Uses small GeoTIFFs written to a temporary directory. Skipped when the GDAL Python
+bindings are not installed.
+"""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("osgeo")
+
+from osgeo import gdal, osr  # noqa: E402
+
+import calculate_extents  # noqa: E402
+
+# 10 x 5 pixel raster at 0.1 degree resolution with its top-left corner at (100, 50)
+WGS84_GEOTRANSFORM = (100.0, 0.1, 0.0, 50.0, 0.0, -0.1)
+WGS84_EXTENTS = {"north": 50.0, "south": 49.5, "east": 101.0, "west": 100.0}
+
+
+def write_geotiff(path: str, geotransform: tuple = WGS84_GEOTRANSFORM, epsg: int = 4326) -> str:
+    """Writes a single-band 10 x 5 GeoTIFF with the given georeferencing."""
+    ds = gdal.GetDriverByName("GTiff").Create(path, 10, 5, 1, gdal.GDT_Byte)
+    ds.SetGeoTransform(geotransform)
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(epsg)
+    ds.SetProjection(srs.ExportToWkt())
+    ds = None
+    return path
+
+
+def run_main(capsys, argv: list):
+    """Runs the CLI and returns its parsed JSON output."""
+    calculate_extents.main(argv)
+    return json.loads(capsys.readouterr().out)
+
+
+def test_densify_ring_single_sample_returns_corners():
+    corners = [(0, 0), (10, 0), (10, 5), (0, 5)]
+    assert calculate_extents._densify_ring(corners, 1) == corners
+
+
+def test_densify_ring_samples_each_edge():
+    corners = [(0, 0), (10, 0), (10, 5), (0, 5)]
+    points = calculate_extents._densify_ring(corners, 21)
+
+    assert len(points) == 80
+    assert len(set(points)) == 80
+    # Each edge starts at its corner and stops one step short of the next one
+    assert [points[i] for i in (0, 20, 40, 60)] == corners
+    assert points[19] == pytest.approx((9.5, 0))
+    assert points[-1] == pytest.approx((0, 0.25))
+
+
+class FakeTransform:
+    """Stands in for a CoordinateTransformation, returning canned TransformPoints results."""
+
+    def __init__(self, results: list):
+        self.results = results
+
+    def TransformPoints(self, points: list) -> list:
+        return self.results
+
+
+def test_transform_points_drops_failed_points():
+    transform = FakeTransform([(1.0, 2.0, 0.0), (float("inf"), float("inf"), 0.0), (3.0, float("nan"), 0.0)])
+    assert calculate_extents._transform_points(transform, [(0, 0)] * 3) == [(1.0, 2.0)]
+
+
+def test_transform_points_raises_when_no_point_transforms():
+    transform = FakeTransform([(float("inf"), float("inf"), 0.0)])
+    with pytest.raises(Exception, match="could be transformed"):
+        calculate_extents._transform_points(transform, [(0, 0)])
+
+
+def test_extents_from_points():
+    extents = calculate_extents._extents_from_points([(100, 50), (101, 49.5), (100.5, 49.8)])
+    assert extents == WGS84_EXTENTS
+
+
+def test_extents_from_points_across_antimeridian():
+    points = [(179, 1), (179.5, 2), (-179.5, 1), (-179, 2)]
+    extents = calculate_extents._extents_from_points(points, wrap_antimeridian=True)
+    assert extents == {"north": 2, "south": 1, "east": -179, "west": 179}
+
+
+def test_extents_from_points_without_wrap_uses_min_max():
+    extents = calculate_extents._extents_from_points([(-100, 0), (100, 50)])
+    assert extents == {"north": 50, "south": 0, "east": 100, "west": -100}
+
+
+@pytest.mark.parametrize("geotransform, expected", [
+    # Whole globe
+    ((-180.0, 36.0, 0.0, 90.0, 0.0, -36.0), {"north": 90.0, "south": -90.0, "east": 180.0, "west": -180.0}),
+    # Wider than 180 degrees without crossing the antimeridian
+    ((-100.0, 20.0, 0.0, 50.0, 0.0, -10.0), {"north": 50.0, "south": 0.0, "east": 100.0, "west": -100.0}),
+])
+def test_get_extents_wide_wgs84_raster_is_not_wrapped(tmp_path, geotransform, expected):
+    path = write_geotiff(str(tmp_path / "wide.tif"), geotransform)
+    assert calculate_extents.get_extents(path) == pytest.approx(expected)
+
+
+def test_get_extents_many_records_errors(tmp_path):
+    good = write_geotiff(str(tmp_path / "good.tif"))
+    missing = str(tmp_path / "missing.tif")
+
+    results = calculate_extents.get_extents_many([good, missing])
+
+    assert results[good] == pytest.approx(WGS84_EXTENTS)
+    assert "error" in results[missing]
+
+
+def test_main_single_file(tmp_path, capsys):
+    path = write_geotiff(str(tmp_path / "image.tif"))
+    assert run_main(capsys, [path]) == pytest.approx(WGS84_EXTENTS)
+
+
+def test_main_projected_file(tmp_path, capsys):
+    # 10 km square in UTM zone 33N, just north of the equator around 15 degrees east
+    path = write_geotiff(str(tmp_path / "utm.tif"), (500000.0, 1000.0, 0.0, 10000.0, 0.0, -2000.0), 32633)
+    extents = run_main(capsys, [path])
+
+    assert 14.9 < extents["west"] < extents["east"] < 15.1
+    assert -1e-6 < extents["south"] < extents["north"] < 0.1
+
+
+def test_main_directory(tmp_path, capsys):
+    first = write_geotiff(str(tmp_path / "a.tif"))
+    second = write_geotiff(str(tmp_path / "b.tif"), (10.0, 0.1, 0.0, 20.0, 0.0, -0.1))
+    write_geotiff(str(tmp_path / "a.tif.ovr"))
+    (tmp_path / "notes.txt").write_text("not a raster")
+
+    output = run_main(capsys, [str(tmp_path)])
+
+    assert sorted(output) == [first, second]
+    assert output[first] == pytest.approx(WGS84_EXTENTS)
+    assert output[second] == pytest.approx({"north": 20.0, "south": 19.5, "east": 11.0, "west": 10.0})
+
+
+def test_main_directory_parallel_matches_serial(tmp_path, capsys):
+    for name in ("a.tif", "b.tif", "c.tif"):
+        write_geotiff(str(tmp_path / name))
+
+    serial = run_main(capsys, [str(tmp_path)])
+    parallel = run_main(capsys, ["--workers", "2", str(tmp_path)])
+
+    assert parallel == serial
+    assert sorted(parallel) == sorted(os.path.join(str(tmp_path), name) for name in ("a.tif", "b.tif", "c.tif"))
@@ -271,9 +271,10 @@ export async function convertImageToCesium(
                 }
                 logger.info("Successfully warped image to EPSG:4326");
 
-                // Step 2: Calculate extents from the warped image
+                // Step 2: Calculate extents from the warped image.
+                // Only install python3 when the image does not already provide it.
                 exec(
-                  `docker exec ${jobName} sh -c "apk add --no-cache python3 >/dev/null 2>&1 && chmod -R 755 /data/images/ && chmod -R 755 /data/scripts/ && python3 /data/scripts/calculate_extents.py /data/images/${warpedFileName}"`,
+                  `docker exec ${jobName} sh -c "command -v python3 >/dev/null 2>&1 || apk add --no-cache python3 >/dev/null 2>&1 && chmod -R 755 /data/images/ && chmod -R 755 /data/scripts/ && python3 /data/scripts/calculate_extents.py /data/images/${warpedFileName}"`,
                   async (err, extentsOutput) => {
                     if (err) {
                       cleanupWarpedFile(warpedFilePath);